@@ -1,29 +1,107 @@
 """Demo script showing how to use Travel Guard API."""
 
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
 import httpx
 
 API_URL = "http://localhost:8000"
 
+# On-disk cache of /verify responses so re-running the demo skips the server
+CACHE_DIR = Path(__file__).parent / ".cache" / "verify"
+CACHE_TTL_SECONDS = 3600
+
+# Output constants, built once rather than on every print_result() call
+BANNER = "=" * 50
+SEVERITY_LABELS = {"low": "LOW", "medium": "MED", "high": "HIGH"}
+
+
+def _cache_file(payload: dict) -> Path:
+    """Cache path for a /verify payload."""
+    key = hashlib.blake2b(json.dumps(payload, sort_keys=True).encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_cache(cache_file: Path) -> dict | None:
+    """Return a cached result if it exists and is still fresh."""
+    try:
+        if time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        pass  # Missing or unreadable (e.g. left by an interrupted run): treat as a miss
+    return None
+
 
-def verify_booking(intent: str, user_location: str = "Madrid") -> dict:
+def _write_cache(cache_file: Path, result: dict):
+    """Store a result, skipping errors."""
+    # Only cache completed verifications, never errors
+    if result.get("success"):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and rename, so readers never see a partial file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(result))
+        os.replace(tmp_file, cache_file)
+
+
+def _payload(intent: str, user_location: str) -> dict:
+    """Build the /verify request body."""
+    return {
+        "intent": intent,
+        "context": {"user_location": user_location}
+    }
+
+
+async def verify_booking(
+    client: httpx.AsyncClient,
+    intent: str,
+    user_location: str = "Madrid",
+) -> dict:
     """
     Verify a booking intent before execution.
 
     Args:
+        client: Client for the Travel Guard API
         intent: Natural language booking request
         user_location: User's current city (for origin inference)
 
     Returns:
         Verification result with confidence, warnings, and recommendations
     """
-    response = httpx.post(
-        f"{API_URL}/verify",
-        json={
-            "intent": intent,
-            "context": {"user_location": user_location}
-        }
-    )
-    return response.json()
+    payload = _payload(intent, user_location)
+    cache_file = _cache_file(payload)
+
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return cached
+
+    response = await client.post("/verify", json=payload)
+    result = response.json()
+    _write_cache(cache_file, result)
+    return result
+
+
+async def verify_bookings(requests: list[tuple[str, str]]) -> list[dict | Exception]:
+    """
+    Verify several booking intents concurrently.
+
+    Args:
+        requests: List of (intent, user_location) pairs
+
+    Returns:
+        Verification results in the same order as the requests; a request
+        that failed (e.g. server not running) gives its exception instead
+    """
+    # One client for the batch, so the requests share keep-alive connections
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30.0) as client:
+        return await asyncio.gather(
+            *(verify_booking(client, i, l) for i, l in requests),
+            return_exceptions=True,
+        )
 
 
 def print_result(result: dict):
@@ -34,48 +112,52 @@ def print_result(result: dict):
 
     r = result["result"]
 
-    print(f"\n{'='*50}")
-    print(f"Confidence: {r['confidence']:.0%}")
-    print(f"Safe to book: {'YES' if r['safe_to_book'] else 'NO - needs clarification'}")
+    # Collect every line and write once instead of one print() per line
+    out: list[str] = []
+
+    out.append(f"\n{BANNER}")
+    out.append(f"Confidence: {r['confidence']:.0%}")
+    out.append(f"Safe to book: {'YES' if r['safe_to_book'] else 'NO - needs clarification'}")
 
-    print(f"\n[Parsed Intent]")
+    out.append(f"\n[Parsed Intent]")
     intent = r["intent"]
-    print(f"   From: {intent.get('origin') or '(not specified)'}")
-    print(f"   To: {intent.get('destination') or '(not specified)'}")
-    print(f"   Date: {intent.get('date') or '(not specified)'}")
-    print(f"   Time: {intent.get('time_preference') or '(any)'}")
+    out.append(f"   From: {intent.get('origin') or '(not specified)'}")
+    out.append(f"   To: {intent.get('destination') or '(not specified)'}")
+    out.append(f"   Date: {intent.get('date') or '(not specified)'}")
+    out.append(f"   Time: {intent.get('time_preference') or '(any)'}")
 
     if r["warnings"]:
-        print(f"\n[Warnings]")
+        out.append(f"\n[Warnings]")
         for w in r["warnings"]:
-            severity = {"low": "LOW", "medium": "MED", "high": "HIGH"}[w["severity"]]
-            print(f"   [{severity}] {w['message']}")
+            out.append(f"   [{SEVERITY_LABELS[w['severity']]}] {w['message']}")
 
     if r["suggestions"]:
-        print(f"\n[Suggestions]")
+        out.append(f"\n[Suggestions]")
         for s in r["suggestions"]:
-            print(f"   - {s}")
+            out.append(f"   - {s}")
 
     if r["matched_bookings"]:
-        print(f"\n[Matched Trains] ({len(r['matched_bookings'])} found)")
+        out.append(f"\n[Matched Trains] ({len(r['matched_bookings'])} found)")
         for i, b in enumerate(r["matched_bookings"][:3], 1):
-            dep = b["departure_time"].split("T")[1][:5]
-            arr = b["arrival_time"].split("T")[1][:5]
+            dep = b["departure_time"].partition("T")[2][:5]
+            arr = b["arrival_time"].partition("T")[2][:5]
             avail = "available" if b["available"] else "SOLD OUT"
-            print(f"   {i}. {b['train_type']} {dep} -> {arr}  EUR {b['price']:.2f} ({avail})")
+            out.append(f"   {i}. {b['train_type']} {dep} -> {arr}  EUR {b['price']:.2f} ({avail})")
 
     if r["recommended_booking"]:
         rec = r["recommended_booking"]
-        dep = rec["departure_time"].split("T")[1][:5]
-        print(f"\n[RECOMMENDED] {rec['train_type']} at {dep} for EUR {rec['price']:.2f}")
+        dep = rec["departure_time"].partition("T")[2][:5]
+        out.append(f"\n[RECOMMENDED] {rec['train_type']} at {dep} for EUR {rec['price']:.2f}")
 
-    print(f"{'='*50}\n")
+    out.append(f"{BANNER}\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
-    print("\n" + "="*50)
+    print("\n" + BANNER)
     print("  TRAVEL GUARD FOR AI - Demo")
-    print("="*50 + "\n")
+    print(BANNER + "\n")
 
     # Test cases showing different scenarios
     test_cases = [
@@ -95,18 +177,22 @@ def main():
         ("Book me a train", "Madrid"),
     ]
 
-    for i, (intent, location) in enumerate(test_cases, 1):
+    # Send all test cases at once; total time is the slowest request, not the sum
+    results = asyncio.run(verify_bookings(test_cases))
+
+    for i, ((intent, location), result) in enumerate(zip(test_cases, results), 1):
         print(f"--- Test {i} ---")
         print(f"Request: \"{intent}\"")
         print(f"Context: User in {location}")
 
-        try:
-            result = verify_booking(intent, location)
-            print_result(result)
-        except httpx.ConnectError:
+        if isinstance(result, httpx.ConnectError):
             print("[ERROR] Server not running!")
             print("Start with: uv run uvicorn src.server:app --reload")
             break
+        if isinstance(result, Exception):
+            raise result
+
+        print_result(result)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,14 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserIntent(BaseModel):
     """Parsed user intent from natural language."""
 
+    model_config = ConfigDict(frozen=True)
+
     origin: Optional[str] = Field(None, description="Departure city/station")
     destination: Optional[str] = Field(None, description="Arrival city/station")
     date: Optional[str] = Field(None, description="Travel date (raw text)")
@@ -18,6 +20,8 @@ class UserIntent(BaseModel):
 class TrainBooking(BaseModel):
     """A train booking option (mirrors renfe_mcp TrainRide)."""
 
+    model_config = ConfigDict(frozen=True)
+
     train_type: str = Field(description="Train type (AVE, ALVIA, etc.)")
     origin: str = Field(description="Origin station name")
     destination: str = Field(description="Destination station name")
@@ -31,6 +35,8 @@ class TrainBooking(BaseModel):
 class VerificationWarning(BaseModel):
     """A warning about potential booking issues."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(description="Warning type: 'location', 'time', 'price', 'availability'")
     message: str = Field(description="Human-readable warning message")
     severity: str = Field("medium", description="Severity: 'low', 'medium', 'high'")
@@ -39,6 +45,8 @@ class VerificationWarning(BaseModel):
 class VerificationResult(BaseModel):
     """Result of verifying a booking intent."""
 
+    model_config = ConfigDict(frozen=True)
+
     confidence: float = Field(description="Confidence score 0.0 - 1.0")
     safe_to_book: bool = Field(description="Whether it's safe to proceed with booking")
 
@@ -53,6 +61,8 @@ class VerificationResult(BaseModel):
 class VerifyRequest(BaseModel):
     """Request to verify a booking intent."""
 
+    model_config = ConfigDict(frozen=True)
+
     intent: str = Field(description="Natural language booking intent")
     context: Optional[dict] = Field(None, description="Additional context (user_location, history, etc.)")
 
@@ -60,6 +70,8 @@ class VerifyRequest(BaseModel):
 class VerifyResponse(BaseModel):
     """Response from verification endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(description="Whether verification completed successfully")
     result: Optional[VerificationResult] = Field(None)
     error: Optional[str] = Field(None)
@@ -1,6 +1,7 @@
 """Travel Guard API server."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -28,62 +29,91 @@ app.add_middleware(
 )
 
 
-# Mock bookings for demo (in production, this would come from renfe_mcp)
+# Mock bookings for demo (in production, this would come from renfe_mcp).
+# Built and validated once; each request copies them with its own stations and date,
+# and model_copy() skips re-running field validation.
+_TEMPLATE_DAY = datetime(2000, 1, 1)
+
+_MOCK_BOOKING_TEMPLATES = (
+    TrainBooking(
+        train_type="AVE",
+        origin="",
+        destination="",
+        departure_time=_TEMPLATE_DAY.replace(hour=6, minute=16),
+        arrival_time=_TEMPLATE_DAY.replace(hour=9, minute=5),
+        duration_minutes=169,
+        price=94.90,
+        available=True,
+    ),
+    TrainBooking(
+        train_type="AVE",
+        origin="",
+        destination="",
+        departure_time=_TEMPLATE_DAY.replace(hour=9, minute=0),
+        arrival_time=_TEMPLATE_DAY.replace(hour=11, minute=49),
+        duration_minutes=169,
+        price=118.60,
+        available=True,
+    ),
+    TrainBooking(
+        train_type="AVE",
+        origin="",
+        destination="",
+        departure_time=_TEMPLATE_DAY.replace(hour=11, minute=30),
+        arrival_time=_TEMPLATE_DAY.replace(hour=14, minute=19),
+        duration_minutes=169,
+        price=89.90,
+        available=True,
+    ),
+    TrainBooking(
+        train_type="ALVIA",
+        origin="",
+        destination="",
+        departure_time=_TEMPLATE_DAY.replace(hour=14, minute=0),
+        arrival_time=_TEMPLATE_DAY.replace(hour=17, minute=30),
+        duration_minutes=210,
+        price=65.00,
+        available=True,
+    ),
+    TrainBooking(
+        train_type="AVE",
+        origin="",
+        destination="",
+        departure_time=_TEMPLATE_DAY.replace(hour=18, minute=0),
+        arrival_time=_TEMPLATE_DAY.replace(hour=20, minute=49),
+        duration_minutes=169,
+        price=94.90,
+        available=False,  # Sold out
+    ),
+)
+
+
+@lru_cache(maxsize=64)
+def _route_templates(origin: str, destination: str) -> tuple[tuple[TrainBooking, timedelta, timedelta], ...]:
+    """Templates with this route's stations filled in, plus each train's time offsets."""
+    origin_station = f"{origin} Pta.Atocha - Almudena Grandes"
+    destination_station = f"{destination}-Sants"
+
+    return tuple(
+        (
+            template.model_copy(update={"origin": origin_station, "destination": destination_station}),
+            template.departure_time - _TEMPLATE_DAY,
+            template.arrival_time - _TEMPLATE_DAY,
+        )
+        for template in _MOCK_BOOKING_TEMPLATES
+    )
+
+
 def get_mock_bookings(origin: str, destination: str, date: datetime) -> list[TrainBooking]:
     """Generate mock bookings for testing."""
     base_time = datetime.combine(date.date(), datetime.min.time())
 
     return [
-        TrainBooking(
-            train_type="AVE",
-            origin=f"{origin} Pta.Atocha - Almudena Grandes",
-            destination=f"{destination}-Sants",
-            departure_time=base_time.replace(hour=6, minute=16),
-            arrival_time=base_time.replace(hour=9, minute=5),
-            duration_minutes=169,
-            price=94.90,
-            available=True,
-        ),
-        TrainBooking(
-            train_type="AVE",
-            origin=f"{origin} Pta.Atocha - Almudena Grandes",
-            destination=f"{destination}-Sants",
-            departure_time=base_time.replace(hour=9, minute=0),
-            arrival_time=base_time.replace(hour=11, minute=49),
-            duration_minutes=169,
-            price=118.60,
-            available=True,
-        ),
-        TrainBooking(
-            train_type="AVE",
-            origin=f"{origin} Pta.Atocha - Almudena Grandes",
-            destination=f"{destination}-Sants",
-            departure_time=base_time.replace(hour=11, minute=30),
-            arrival_time=base_time.replace(hour=14, minute=19),
-            duration_minutes=169,
-            price=89.90,
-            available=True,
-        ),
-        TrainBooking(
-            train_type="ALVIA",
-            origin=f"{origin} Pta.Atocha - Almudena Grandes",
-            destination=f"{destination}-Sants",
-            departure_time=base_time.replace(hour=14, minute=0),
-            arrival_time=base_time.replace(hour=17, minute=30),
-            duration_minutes=210,
-            price=65.00,
-            available=True,
-        ),
-        TrainBooking(
-            train_type="AVE",
-            origin=f"{origin} Pta.Atocha - Almudena Grandes",
-            destination=f"{destination}-Sants",
-            departure_time=base_time.replace(hour=18, minute=0),
-            arrival_time=base_time.replace(hour=20, minute=49),
-            duration_minutes=169,
-            price=94.90,
-            available=False,  # Sold out
-        ),
+        template.model_copy(update={
+            "departure_time": base_time + departure_offset,
+            "arrival_time": base_time + arrival_offset,
+        })
+        for template, departure_offset, arrival_offset in _route_templates(origin, destination)
     ]
 
 
@@ -147,7 +177,7 @@ async def verify_booking(request: VerifyRequest):
         )
 
 
-@app.post("/verify/quick")
+@app.post("/verify/quick", response_model=VerifyResponse)
 async def quick_verify(intent: str, user_location: str = "Madrid"):
     """
     Quick verification with minimal input.
@@ -1,8 +1,9 @@
 """Date and time parsing for travel verification."""
 
-from datetime import datetime, timedelta
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
-from dateutil import parser as date_parser
 
 
 # Time ranges for general preferences
@@ -15,6 +16,13 @@ TIME_RANGES = {
     "late": (18, 24),      # 18:00 - 00:00
 }
 
+# Formats the intent parser emits, tried with strptime before falling back to dateutil
+FAST_DATE_FORMATS = (
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), "%d/%m/%Y"),
+    (re.compile(r"\d{1,2}/\d{1,2}"), "%d/%m"),
+)
+
 
 def parse_datetime(date_str: Optional[str], base_date: Optional[datetime] = None) -> Optional[datetime]:
     """
@@ -60,21 +68,52 @@ def parse_datetime(date_str: Optional[str], base_date: Optional[datetime] = None
         return base + timedelta(days=days_ahead)
 
     # Try parsing with dateutil
-    try:
-        # European date format (day first)
-        parsed = date_parser.parse(date_str, dayfirst=True)
+    parsed = _parse_date_text(date_str, date.today().toordinal())
+    if parsed is None:
+        return None
+
+    # If year not specified, use current year (or next year if date passed)
+    if parsed.year == 1900:  # dateutil default when year not specified
+        parsed = parsed.replace(year=base.year)
+        if parsed < base:
+            parsed = parsed.replace(year=base.year + 1)
+
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def _parse_date_text(date_str: str, today_ordinal: int) -> Optional[datetime]:
+    """
+    Cached dateutil parse of an absolute date string.
 
-        # If year not specified, use current year (or next year if date passed)
-        if parsed.year == 1900:  # dateutil default when year not specified
-            parsed = parsed.replace(year=base.year)
-            if parsed < base:
-                parsed = parsed.replace(year=base.year + 1)
+    dateutil fills missing fields from today's date, so the cache is keyed
+    on today_ordinal as well to stay correct across midnight.
+    """
+    # Fast path for the known numeric formats
+    text = date_str.strip()
+    for pattern, fmt in FAST_DATE_FORMATS:
+        if pattern.fullmatch(text):
+            if "%Y" not in fmt:
+                # Match dateutil: missing year comes from today. Parsing it
+                # rather than defaulting to 1900 keeps 29/02 valid in leap years.
+                text = f"{text}/{date.fromordinal(today_ordinal).year}"
+                fmt = f"{fmt}/%Y"
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                break  # Let dateutil try (e.g. month-first dates)
+
+    # Imported here so the fast path never pays dateutil's import cost
+    from dateutil import parser as date_parser
 
-        return parsed
+    try:
+        # European date format (day first)
+        return date_parser.parse(date_str, dayfirst=True)
     except (ValueError, date_parser.ParserError):
         return None
 
 
+@lru_cache(maxsize=256)
 def parse_time_preference(time_pref: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     """
     Parse a time preference into hour range.
@@ -131,20 +170,52 @@ def is_time_in_preference(
     if not time_preference:
         return (True, 1.0)  # No preference means all times match
 
-    min_hour, max_hour = parse_time_preference(time_preference)
+    return match_hour(departure_time.hour, parse_time_preference(time_preference))
+
+
+def match_hour(
+    hour: int,
+    hour_range: Tuple[Optional[int], Optional[int]]
+) -> Tuple[bool, float]:
+    """
+    Check if a departure hour falls in an already-parsed preference range.
+
+    Lets callers scoring many bookings parse the preference once.
+
+    Args:
+        hour: Departure hour (0-23)
+        hour_range: (min_hour, max_hour) from parse_time_preference
+
+    Returns:
+        Tuple of (matches, confidence)
+    """
+    min_hour, max_hour = hour_range
 
     if min_hour is None:
         return (True, 0.5)  # Couldn't parse preference
 
-    hour = departure_time.hour
-
     if min_hour <= hour <= max_hour:
-        # Calculate how close to the center of the range
-        center = (min_hour + max_hour) / 2
-        distance = abs(hour - center)
-        max_distance = (max_hour - min_hour) / 2
-        confidence = 1.0 - (distance / max_distance) * 0.3  # Max 30% penalty
+        # Distance from the center of the range, kept as integers by doubling:
+        # 2 * |hour - center| over 2 * half-width, no float center needed
+        distance_x2 = abs(2 * hour - min_hour - max_hour)
+        span = (max_hour - min_hour) or 1
+        confidence = 1.0 - (distance_x2 / span) * 0.3  # Max 30% penalty
 
         return (True, confidence)
 
     return (False, 0.0)
+
+
+@lru_cache(maxsize=256)
+def hour_scores_for_preference(time_pref: Optional[str]) -> Tuple[Tuple[bool, float], ...]:
+    """
+    Score every departure hour against a time preference.
+
+    Args:
+        time_pref: Time preference (e.g., "morning", "09:00")
+
+    Returns:
+        Tuple of 24 (matches, confidence) pairs, indexed by hour
+    """
+    hour_range = parse_time_preference(time_pref)
+    return tuple(match_hour(hour, hour_range) for hour in range(24))
@@ -3,34 +3,61 @@
 import re
 from typing import Optional
 from ..models import UserIntent
+from .normalize import fold_accents
 
 
-# Common Spanish cities for train travel
+# Common Spanish cities for train travel (accent-free; input is folded before matching)
 SPANISH_CITIES = [
-    "madrid", "barcelona", "valencia", "sevilla", "seville", "malaga", "málaga",
-    "bilbao", "zaragoza", "alicante", "cordoba", "córdoba", "granada", "murcia",
-    "valladolid", "vigo", "gijon", "gijón", "santander", "pamplona", "leon", "león",
-    "toledo", "salamanca", "burgos", "san sebastian", "san sebastián", "donostia",
-    "tarragona", "lleida", "girona", "cadiz", "cádiz", "almeria", "almería",
-    "oviedo", "logroño", "vitoria", "huesca", "teruel", "cuenca", "segovia", "avila", "ávila"
+    "madrid", "barcelona", "valencia", "sevilla", "seville", "malaga",
+    "bilbao", "zaragoza", "alicante", "cordoba", "granada", "murcia",
+    "valladolid", "vigo", "gijon", "santander", "pamplona", "leon",
+    "toledo", "salamanca", "burgos", "san sebastian", "donostia",
+    "tarragona", "lleida", "girona", "cadiz", "almeria",
+    "oviedo", "logrono", "vitoria", "huesca", "teruel", "cuenca", "segovia", "avila"
 ]
 
-# Time patterns
+# O(1) exact lookup and list position (earlier cities win when several are mentioned)
+_CITY_SET = frozenset(SPANISH_CITIES)
+_CITY_RANK = {city: i for i, city in enumerate(SPANISH_CITIES)}
+
+# All cities as one alternation, longest first so "san sebastian" beats shorter names.
+# One linear scan replaces a separate search per city. Each city has its own group, so
+# match.lastindex names the city even when IGNORECASE matched it through Unicode case
+# folding (e.g. "ſevilla"), where the matched text is not the city key.
+_CITIES_BY_LENGTH = sorted(SPANISH_CITIES, key=len, reverse=True)
+_CITY_ALTERNATION = "|".join(f"({re.escape(city)})" for city in _CITIES_BY_LENGTH)
+_CITIES_RE = re.compile(rf"\b(?:{_CITY_ALTERNATION})\b", re.IGNORECASE)
+_CITIES_ANYWHERE_RE = re.compile(_CITY_ALTERNATION, re.IGNORECASE)
+
+# Time patterns (compiled once at import)
 TIME_PATTERNS = {
-    "morning": r"\b(morning|mañana|am|early)\b",
-    "afternoon": r"\b(afternoon|tarde|pm|midday)\b",
-    "evening": r"\b(evening|noche|night|late)\b",
-    "specific": r"\b(\d{1,2})[:\.]?(\d{2})?\s*(am|pm|h|hours?)?\b",
+    "morning": re.compile(r"\b(morning|mañana|am|early)\b", re.IGNORECASE),
+    "afternoon": re.compile(r"\b(afternoon|tarde|pm|midday)\b", re.IGNORECASE),
+    "evening": re.compile(r"\b(evening|noche|night|late)\b", re.IGNORECASE),
+    "specific": re.compile(r"\b(\d{1,2})[:\.]?(\d{2})?\s*(am|pm|h|hours?)?\b", re.IGNORECASE),
 }
 
-# Date patterns
+# Date patterns (compiled once at import)
 DATE_PATTERNS = {
-    "tomorrow": r"\b(tomorrow|mañana)\b",
-    "today": r"\b(today|hoy)\b",
-    "day_of_week": r"\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday|lunes|martes|miércoles|jueves|viernes|sábado|domingo)\b",
-    "specific_date": r"\b(\d{1,2})[/\-.](\d{1,2})[/\-.]?(\d{2,4})?\b",
+    "tomorrow": re.compile(r"\b(tomorrow|mañana)\b", re.IGNORECASE),
+    "today": re.compile(r"\b(today|hoy)\b", re.IGNORECASE),
+    "day_of_week": re.compile(r"\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday|lunes|martes|miércoles|jueves|viernes|sábado|domingo)\b", re.IGNORECASE),
+    "specific_date": re.compile(r"\b(\d{1,2})[/\-.](\d{1,2})[/\-.]?(\d{2,4})?\b"),
 }
 
+# Destination patterns: "to <city>" or "a <city>"
+DESTINATION_PATTERNS = [
+    re.compile(r"\bto\s+([a-záéíóúñ]+)(?:\s|$)", re.IGNORECASE),  # Single word after "to"
+    re.compile(r"\ba\s+([a-záéíóúñ]+)(?:\s|$)", re.IGNORECASE),   # Single word after "a" (Spanish)
+]
+
+# Origin patterns: "from <city>" or "de <city>" or "desde <city>"
+ORIGIN_PATTERNS = [
+    re.compile(r"\bfrom\s+([a-záéíóúñ\s]+?)(?:\s+to\b|\s*$)", re.IGNORECASE),
+    re.compile(r"\bde\s+([a-záéíóúñ\s]+?)(?:\s+a\b|\s*$)", re.IGNORECASE),
+    re.compile(r"\bdesde\s+([a-záéíóúñ\s]+?)(?:\s+a\b|\s*$)", re.IGNORECASE),
+]
+
 
 def parse_intent(text: str, context: Optional[dict] = None) -> UserIntent:
     """
@@ -74,14 +101,8 @@ def _extract_destination(text: str) -> Optional[str]:
         "train tomorrow", "train today", "tren mañana", "tren hoy"
     }
 
-    # Pattern: "to <city>" or "a <city>"
-    patterns = [
-        r"\bto\s+([a-záéíóúñ]+)(?:\s|$)",  # Single word after "to"
-        r"\ba\s+([a-záéíóúñ]+)(?:\s|$)",   # Single word after "a" (Spanish)
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in DESTINATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             candidate = match.group(1).strip()
 
@@ -90,34 +111,26 @@ def _extract_destination(text: str) -> Optional[str]:
                 continue
 
             # Check if it's a known city
-            for city in SPANISH_CITIES:
-                if city == candidate.lower():
-                    return city.title()
+            if fold_accents(candidate.lower()) in _CITY_SET:
+                return candidate.lower().title()
 
     # Fallback: look for any city mentioned in the text
-    for city in SPANISH_CITIES:
-        if re.search(rf"\b{city}\b", text, re.IGNORECASE):
-            return city.title()
+    city = _first_known_city(text, _CITIES_RE)
+    if city:
+        return city.title()
 
     return None
 
 
 def _extract_origin(text: str, context: dict) -> Optional[str]:
     """Extract origin city from text or context."""
-    # Pattern: "from <city>" or "de <city>" or "desde <city>"
-    patterns = [
-        r"\bfrom\s+([a-záéíóúñ\s]+?)(?:\s+to\b|\s*$)",
-        r"\bde\s+([a-záéíóúñ\s]+?)(?:\s+a\b|\s*$)",
-        r"\bdesde\s+([a-záéíóúñ\s]+?)(?:\s+a\b|\s*$)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in ORIGIN_PATTERNS:
+        match = pattern.search(text)
         if match:
             candidate = match.group(1).strip()
-            for city in SPANISH_CITIES:
-                if city in candidate.lower():
-                    return city.title()
+            city = _first_known_city(candidate, _CITIES_ANYWHERE_RE)
+            if city:
+                return city.title()
             if len(candidate) > 2:
                 return candidate.title()
 
@@ -128,22 +141,41 @@ def _extract_origin(text: str, context: dict) -> Optional[str]:
     return None
 
 
+def _first_known_city(text: str, pattern: re.Pattern) -> Optional[str]:
+    """
+    Return the mentioned city that comes first in SPANISH_CITIES.
+
+    Matching runs on the accent-folded text, but the city is returned as
+    spelled in the input (e.g. "málaga" stays "málaga") unless it only
+    matched through case folding, in which case the list spelling is used.
+    """
+    folded = fold_accents(text)
+    mentioned: dict[str, str] = {}
+    for match in pattern.finditer(folded):
+        city = _CITIES_BY_LENGTH[match.lastindex - 1]
+        spelled = text[match.start():match.end()]
+        mentioned.setdefault(city, spelled if fold_accents(spelled) == city else city)
+    if not mentioned:
+        return None
+    return mentioned[min(mentioned, key=_CITY_RANK.__getitem__)]
+
+
 def _extract_date(text: str) -> Optional[str]:
     """Extract date from text."""
     # Check for relative dates first
-    if re.search(DATE_PATTERNS["tomorrow"], text, re.IGNORECASE):
+    if DATE_PATTERNS["tomorrow"].search(text):
         return "tomorrow"
 
-    if re.search(DATE_PATTERNS["today"], text, re.IGNORECASE):
+    if DATE_PATTERNS["today"].search(text):
         return "today"
 
     # Check for day of week
-    match = re.search(DATE_PATTERNS["day_of_week"], text, re.IGNORECASE)
+    match = DATE_PATTERNS["day_of_week"].search(text)
     if match:
         return match.group(1).lower()
 
     # Check for specific date
-    match = re.search(DATE_PATTERNS["specific_date"], text)
+    match = DATE_PATTERNS["specific_date"].search(text)
     if match:
         day, month, year = match.groups()
         if year:
@@ -156,7 +188,7 @@ def _extract_date(text: str) -> Optional[str]:
 def _extract_time_preference(text: str) -> Optional[str]:
     """Extract time preference from text."""
     # Check for specific time first
-    match = re.search(TIME_PATTERNS["specific"], text, re.IGNORECASE)
+    match = TIME_PATTERNS["specific"].search(text)
     if match:
         hour = int(match.group(1))
         minutes = match.group(2) or "00"
@@ -171,13 +203,13 @@ def _extract_time_preference(text: str) -> Optional[str]:
         return f"{hour:02d}:{minutes}"
 
     # Check for general time periods
-    if re.search(TIME_PATTERNS["morning"], text, re.IGNORECASE):
+    if TIME_PATTERNS["morning"].search(text):
         return "morning"
 
-    if re.search(TIME_PATTERNS["afternoon"], text, re.IGNORECASE):
+    if TIME_PATTERNS["afternoon"].search(text):
         return "afternoon"
 
-    if re.search(TIME_PATTERNS["evening"], text, re.IGNORECASE):
+    if TIME_PATTERNS["evening"].search(text):
         return "evening"
 
     return None
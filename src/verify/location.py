@@ -1,67 +1,189 @@
 """Location disambiguation for Spanish train stations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Optional
 
+from .normalize import fold_accents
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StationMatch:
-    """A matched station with confidence."""
+    """A matched station with confidence (immutable, so results can be cached)."""
     name: str
     code: str
     confidence: float
     is_ambiguous: bool = False
-    alternatives: list[str] | None = None
+    alternatives: tuple[str, ...] | None = None
 
 
-# Known station mappings (city -> stations)
+# Known station mappings (accent-free city -> stations); queries are folded before lookup.
+# The primary station is listed first.
 CITY_STATIONS = {
-    "madrid": [
-        ("Madrid Pta.Atocha - Almudena Grandes", "60000", True),  # Main station
-        ("Madrid-Chamartín-Clara Campoamor", "17000", False),
-        ("Madrid - Atocha Cercanías", "18000", False),
-    ],
-    "barcelona": [
-        ("Barcelona-Sants", "71801", True),  # Main station
-        ("Barcelona-Passeig de Gràcia", "71802", False),
-        ("Barcelona-Estació de França", "71803", False),
-    ],
-    "valencia": [
-        ("Valencia Joaquín Sorolla", "65000", True),
-        ("Valencia Nord", "65001", False),
-    ],
-    "sevilla": [
-        ("Sevilla-Santa Justa", "51003", True),
-    ],
-    "seville": [
-        ("Sevilla-Santa Justa", "51003", True),
-    ],
-    "malaga": [
-        ("Málaga María Zambrano", "31002", True),
-    ],
-    "málaga": [
-        ("Málaga María Zambrano", "31002", True),
-    ],
-    "bilbao": [
-        ("Bilbao-Abando Indalecio Prieto", "13002", True),
-    ],
-    "zaragoza": [
-        ("Zaragoza-Delicias", "70002", True),
-    ],
-    "alicante": [
-        ("Alicante Terminal", "69001", True),
-    ],
-    "cordoba": [
-        ("Córdoba Central", "50001", True),
-    ],
-    "córdoba": [
-        ("Córdoba Central", "50001", True),
-    ],
-    "granada": [
-        ("Granada", "30001", True),
-    ],
+    "madrid": (
+        ("Madrid Pta.Atocha - Almudena Grandes", "60000"),  # Main station
+        ("Madrid-Chamartín-Clara Campoamor", "17000"),
+        ("Madrid - Atocha Cercanías", "18000"),
+    ),
+    "barcelona": (
+        ("Barcelona-Sants", "71801"),  # Main station
+        ("Barcelona-Passeig de Gràcia", "71802"),
+        ("Barcelona-Estació de França", "71803"),
+    ),
+    "valencia": (
+        ("Valencia Joaquín Sorolla", "65000"),
+        ("Valencia Nord", "65001"),
+    ),
+    "sevilla": (
+        ("Sevilla-Santa Justa", "51003"),
+    ),
+    "seville": (
+        ("Sevilla-Santa Justa", "51003"),
+    ),
+    "malaga": (
+        ("Málaga María Zambrano", "31002"),
+    ),
+    "bilbao": (
+        ("Bilbao-Abando Indalecio Prieto", "13002"),
+    ),
+    "zaragoza": (
+        ("Zaragoza-Delicias", "70002"),
+    ),
+    "alicante": (
+        ("Alicante Terminal", "69001"),
+    ),
+    "cordoba": (
+        ("Córdoba Central", "50001"),
+    ),
+    "granada": (
+        ("Granada", "30001"),
+    ),
 }
 
 
+def _build_city_match(stations: tuple[tuple[str, str], ...]) -> StationMatch:
+    """Direct-match result for a city, resolved once at import."""
+    primary = stations[0]  # Primary station is listed first
+    alternatives = tuple(s[0] for s in stations[1:])
+
+    return StationMatch(
+        name=primary[0],
+        code=primary[1],
+        confidence=1.0 if len(stations) == 1 else 0.8,
+        is_ambiguous=len(stations) > 1,
+        alternatives=alternatives or None,
+    )
+
+
+# Primary station and alternatives per city; lookups reuse these instead of rebuilding
+_CITY_INDEX = {city: _build_city_match(stations) for city, stations in CITY_STATIONS.items()}
+
+
+def _single_deletes(word: str) -> set[str]:
+    """All strings formed by deleting one character from word."""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _build_delete_index() -> dict[str, tuple[str, ...]]:
+    """Map each key and its single deletions to the keys that produce them, in order."""
+    index: dict[str, list[str]] = {}
+    for city in CITY_STATIONS:
+        for variant in {city} | _single_deletes(city):
+            index.setdefault(variant, []).append(city)
+    return {variant: tuple(cities) for variant, cities in index.items()}
+
+
+# Typo index: each key and its one-character deletions -> keys sharing that variant.
+# Every key within one edit of a query shares a variant with it, but so do some keys
+# two edits away ("xmadri" and "madrid" share "madri"), so hits are checked with
+# _within_one_edit before being accepted.
+_CITY_DELETES = _build_delete_index()
+
+# CITY_STATIONS order, used to pick the earliest key among several candidates
+_CITY_KEY_RANK = {city: i for i, city in enumerate(CITY_STATIONS)}
+
+# Shorter queries are too likely to be one edit away from an unrelated key
+_MIN_TYPO_LENGTH = 4
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """
+    Check whether two strings differ by at most one edit.
+
+    An edit is one insert, delete, substitution or swap of adjacent characters.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        True if a and b are at most one edit apart
+    """
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a  # a is the shorter (or equal-length) string
+
+    # Skip the common prefix; the edit (if any) is at position i
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]  # One character inserted into b
+    if i == len(a):
+        return True  # Identical
+    if a[i + 1:] == b[i + 1:]:
+        return True  # Substitution
+    return (  # Adjacent swap
+        i + 1 < len(a)
+        and a[i] == b[i + 1]
+        and a[i + 1] == b[i]
+        and a[i + 2:] == b[i + 2:]
+    )
+
+
+def _fuzzy_city_key(city_lower: str) -> Optional[str]:
+    """
+    Find the first CITY_STATIONS key that contains, or is contained in, the query.
+
+    Args:
+        city_lower: Lowercased, stripped city name
+
+    Returns:
+        Matching CITY_STATIONS key or None
+    """
+    for city in CITY_STATIONS:
+        if city in city_lower or city_lower in city:
+            return city
+    return None
+
+
+def _typo_city_key(city_lower: str) -> Optional[str]:
+    """
+    Find the first CITY_STATIONS key within one edit of the query.
+
+    Args:
+        city_lower: Lowercased, stripped city name
+
+    Returns:
+        Matching CITY_STATIONS key or None
+    """
+    if len(city_lower) < _MIN_TYPO_LENGTH:
+        return None
+
+    candidates = {
+        city
+        for variant in {city_lower} | _single_deletes(city_lower)
+        for city in _CITY_DELETES.get(variant, ())
+        if _within_one_edit(city_lower, city)
+    }
+    if not candidates:
+        return None
+    return min(candidates, key=_CITY_KEY_RANK.__getitem__)
+
+
+@lru_cache(maxsize=1024)
 def disambiguate_location(city_name: str) -> StationMatch:
     """
     Disambiguate a city name to specific station(s).
@@ -72,36 +194,25 @@ def disambiguate_location(city_name: str) -> StationMatch:
     Returns:
         StationMatch with best match and alternatives
     """
-    city_lower = city_name.lower().strip()
+    city_lower = fold_accents(city_name.lower().strip())
 
     # Direct match
-    if city_lower in CITY_STATIONS:
-        stations = CITY_STATIONS[city_lower]
-        primary = next((s for s in stations if s[2]), stations[0])  # Get primary station
-
-        alternatives = [s[0] for s in stations if s[0] != primary[0]]
-
-        return StationMatch(
-            name=primary[0],
-            code=primary[1],
-            confidence=1.0 if len(stations) == 1 else 0.8,
-            is_ambiguous=len(stations) > 1,
-            alternatives=alternatives if alternatives else None,
-        )
+    match = _CITY_INDEX.get(city_lower)
+    if match:
+        return match
 
     # Fuzzy match - check if city is substring
-    for city, stations in CITY_STATIONS.items():
-        if city in city_lower or city_lower in city:
-            primary = next((s for s in stations if s[2]), stations[0])
-            alternatives = [s[0] for s in stations if s[0] != primary[0]]
-
-            return StationMatch(
-                name=primary[0],
-                code=primary[1],
-                confidence=0.7,
-                is_ambiguous=True,
-                alternatives=alternatives if alternatives else None,
-            )
+    city = _fuzzy_city_key(city_lower)
+    if city:
+        return replace(_CITY_INDEX[city], confidence=0.7, is_ambiguous=True)
+
+    # Typo match - one edit away from a known city (e.g. "Barcelna"). A real city
+    # missing from the table can be one edit from one that is listed ("Palencia" vs
+    # "Valencia"), so this is only a suggestion: confidence stays below the matcher's
+    # 0.5 "unknown" threshold and the other city's stations are not offered.
+    city = _typo_city_key(city_lower)
+    if city:
+        return replace(_CITY_INDEX[city], confidence=0.4, is_ambiguous=True, alternatives=None)
 
     # No match found
     return StationMatch(
@@ -123,14 +234,20 @@ def get_all_stations_for_city(city_name: str) -> list[tuple[str, str]]:
     Returns:
         List of (station_name, station_code) tuples
     """
-    city_lower = city_name.lower().strip()
+    return list(_stations_for_city(city_name))
+
+
+@lru_cache(maxsize=512)
+def _stations_for_city(city_name: str) -> tuple[tuple[str, str], ...]:
+    """Cached lookup behind get_all_stations_for_city (a tuple, so it can't be mutated)."""
+    city_lower = fold_accents(city_name.lower().strip())
 
     if city_lower in CITY_STATIONS:
-        return [(s[0], s[1]) for s in CITY_STATIONS[city_lower]]
+        return CITY_STATIONS[city_lower]
 
     # Fuzzy match
-    for city, stations in CITY_STATIONS.items():
-        if city in city_lower or city_lower in city:
-            return [(s[0], s[1]) for s in stations]
+    city = _fuzzy_city_key(city_lower)
+    if city:
+        return CITY_STATIONS[city]
 
-    return []
+    return ()
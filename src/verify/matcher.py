@@ -1,5 +1,6 @@
 """Match user intent to available train bookings."""
 
+import heapq
 from datetime import datetime
 from typing import Optional
 
@@ -9,8 +10,9 @@ from ..models import (
     VerificationResult,
     VerificationWarning,
 )
+from .intent_parser import parse_intent
 from .location import disambiguate_location
-from .datetime_parser import parse_datetime, is_time_in_preference
+from .datetime_parser import parse_datetime, hour_scores_for_preference
 
 
 def match_intent_to_bookings(
@@ -30,6 +32,10 @@ def match_intent_to_bookings(
     warnings: list[VerificationWarning] = []
     suggestions: list[str] = []
     confidence = 1.0
+    high_severity_count = 0  # Counted as warnings are added
+
+    # One clock read for the whole verification
+    now = datetime.now()
 
     # Validate destination
     if not intent.destination:
@@ -38,6 +44,7 @@ def match_intent_to_bookings(
             message="No destination specified",
             severity="high",
         ))
+        high_severity_count += 1
         confidence *= 0.3
         suggestions.append("Please specify a destination city")
     else:
@@ -52,11 +59,16 @@ def match_intent_to_bookings(
             suggestions.append(f"Confirm destination: {dest_match.name}?")
 
         if dest_match.confidence < 0.5:
+            message = f"Unknown destination: {intent.destination}"
+            if dest_match.code:
+                # Typo fallback found a close known city; offer it, but don't trust it
+                message += f" (did you mean {dest_match.name}?)"
             warnings.append(VerificationWarning(
                 type="location",
-                message=f"Unknown destination: {intent.destination}",
+                message=message,
                 severity="high",
             ))
+            high_severity_count += 1
             confidence *= 0.5
 
     # Validate origin
@@ -87,20 +99,22 @@ def match_intent_to_bookings(
         ))
         confidence *= 0.9
     else:
-        parsed_date = parse_datetime(intent.date)
+        parsed_date = parse_datetime(intent.date, now)
         if not parsed_date:
             warnings.append(VerificationWarning(
                 type="time",
                 message=f"Could not parse date: {intent.date}",
                 severity="high",
             ))
+            high_severity_count += 1
             confidence *= 0.5
-        elif parsed_date < datetime.now():
+        elif parsed_date < now:
             warnings.append(VerificationWarning(
                 type="time",
                 message="Date is in the past",
                 severity="high",
             ))
+            high_severity_count += 1
             confidence *= 0.3
 
     # Validate time preference
@@ -113,40 +127,42 @@ def match_intent_to_bookings(
             ))
             confidence *= 0.95
 
-    # Filter and score bookings
-    matched_bookings: list[tuple[TrainBooking, float]] = []
-
-    for booking in available_bookings:
-        score = 1.0
-
-        # Check time preference match
-        time_matches, time_confidence = is_time_in_preference(
-            booking.departure_time,
-            intent.time_preference
-        )
+    # Filter and score bookings, keeping scores in a list parallel to the bookings
+    matched_bookings: list[TrainBooking]
+    scores: list[float]
 
-        if not time_matches:
-            continue  # Skip bookings that don't match time preference
+    if not intent.time_preference:
+        # No time filter: score on availability alone
+        matched_bookings = available_bookings
+        scores = [1.0 if booking.available else 0.1 for booking in available_bookings]
+    else:
+        # Per-hour scores, shared by every call with the same preference
+        hour_scores = hour_scores_for_preference(intent.time_preference)
 
-        score *= time_confidence
+        matched_bookings = []
+        scores = []
+        for booking in available_bookings:
+            time_matches, score = hour_scores[booking.departure_time.hour]
 
-        # Check availability
-        if not booking.available:
-            score *= 0.1  # Heavy penalty for unavailable
+            if not time_matches:
+                continue  # Skip bookings that don't match time preference
 
-        matched_bookings.append((booking, score))
+            # Check availability
+            if not booking.available:
+                score *= 0.1  # Heavy penalty for unavailable
 
-    # Sort by score
-    matched_bookings.sort(key=lambda x: x[1], reverse=True)
+            matched_bookings.append(booking)
+            scores.append(score)
 
-    # Extract just the bookings
-    final_bookings = [b for b, _ in matched_bookings]
+    # Keep the top 5 by score (same order as a stable descending sort)
+    top_indices = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
+    final_bookings = [matched_bookings[i] for i in top_indices]
     recommended = final_bookings[0] if final_bookings else None
 
     # Determine if safe to book
     safe_to_book = (
         confidence >= 0.7
-        and len([w for w in warnings if w.severity == "high"]) == 0
+        and high_severity_count == 0
         and recommended is not None
         and recommended.available
     )
@@ -157,7 +173,7 @@ def match_intent_to_bookings(
         intent=intent,
         warnings=warnings,
         suggestions=suggestions,
-        matched_bookings=final_bookings[:5],  # Top 5 matches
+        matched_bookings=final_bookings,  # Top 5 matches
         recommended_booking=recommended,
     )
 
@@ -178,7 +194,5 @@ def quick_verify(
     Returns:
         VerificationResult
     """
-    from .intent_parser import parse_intent
-
     intent = parse_intent(intent_text, context)
     return match_intent_to_bookings(intent, bookings)
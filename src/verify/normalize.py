@@ -0,0 +1,18 @@
+"""Text normalization shared by the verification modules."""
+
+
+# Spanish accent folding; one-to-one per character, so match offsets carry over
+ACCENT_FOLD = str.maketrans("áéíóúüñÁÉÍÓÚÜÑ", "aeiouunAEIOUUN")
+
+
+def fold_accents(text: str) -> str:
+    """
+    Strip Spanish accents so "Málaga" and "Malaga" compare equal.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Text with the same length and accents removed
+    """
+    return text.translate(ACCENT_FOLD)
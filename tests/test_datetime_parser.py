@@ -0,0 +1,90 @@
+"""Tests for date and time parsing."""
+
+import pytest
+from datetime import date, datetime
+
+from src.verify.datetime_parser import (
+    parse_datetime,
+    parse_time_preference,
+    hour_scores_for_preference,
+    _parse_date_text,
+)
+
+
+class TestParseDatetime:
+    """Test date parsing."""
+
+    def test_tomorrow(self):
+        """Relative dates are offset from the base date."""
+        base = datetime(2026, 3, 10, 8, 30)
+        assert parse_datetime("tomorrow", base) == datetime(2026, 3, 11, 8, 30)
+
+    def test_day_of_week(self):
+        """Day of week resolves to the next occurrence."""
+        base = datetime(2026, 3, 10)  # Tuesday
+        assert parse_datetime("friday", base) == datetime(2026, 3, 13)
+        assert parse_datetime("tuesday", base) == datetime(2026, 3, 17)
+
+    def test_european_date_with_year(self):
+        """Day comes before month."""
+        assert parse_datetime("5/6/2027") == datetime(2027, 6, 5)
+
+    def test_european_date_without_year(self):
+        """Missing year is filled in."""
+        parsed = parse_datetime("25/12")
+        assert (parsed.month, parsed.day) == (12, 25)
+
+    def test_leap_day_without_year(self):
+        """29/02 parses in a leap year and is rejected otherwise."""
+        leap_today = date(2028, 1, 10).toordinal()
+        assert _parse_date_text("29/02", leap_today) == datetime(2028, 2, 29)
+
+        plain_today = date(2027, 1, 10).toordinal()
+        assert _parse_date_text("29/02", plain_today) is None
+
+    def test_iso_date(self):
+        """ISO dates are year-month-day, even when the day is <= 12."""
+        assert parse_datetime("2027-01-05") == datetime(2027, 1, 5)
+
+    def test_month_first_fallback(self):
+        """Dates that are invalid day-first still parse via dateutil."""
+        parsed = parse_datetime("12/25")
+        assert (parsed.month, parsed.day) == (12, 25)
+
+    def test_invalid_date(self):
+        """Unparseable dates return None."""
+        assert parse_datetime("31/04") is None
+        assert parse_datetime("not a date") is None
+        assert parse_datetime(None) is None
+
+
+class TestParseTimePreference:
+    """Test time preference parsing."""
+
+    def test_period(self):
+        """General periods map to hour ranges."""
+        assert parse_time_preference("morning") == (6, 12)
+
+    def test_specific_time(self):
+        """Specific times get a window around the hour."""
+        assert parse_time_preference("09:00") == (8, 10)
+
+    def test_no_preference(self):
+        """No preference returns an open range."""
+        assert parse_time_preference(None) == (None, None)
+
+
+class TestHourScoresForPreference:
+    """Test per-hour preference scoring."""
+
+    def test_period_scores(self):
+        """Hours inside the period match, with the center scoring highest."""
+        scores = hour_scores_for_preference("morning")
+        assert len(scores) == 24
+        assert scores[9] == (True, 1.0)
+        assert scores[6][0] and scores[6][1] < 1.0
+        assert scores[14] == (False, 0.0)
+
+    def test_unparsed_preference(self):
+        """An unknown preference matches every hour at reduced confidence."""
+        assert set(hour_scores_for_preference("whenever")) == {(True, 0.5)}
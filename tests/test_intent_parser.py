@@ -65,6 +65,22 @@ class TestIntentParser:
         assert intent.destination == "Barcelona"
         assert intent.date == "25/12"
 
+    def test_city_without_preposition(self):
+        """Fall back to any city mentioned in the text."""
+        intent = parse_intent("Billete Barcelona-Sants")
+        assert intent.destination == "Barcelona"
+
+    def test_multi_word_city(self):
+        """Match multi-word city names."""
+        intent = parse_intent("Tren hoy, San Sebastián")
+        assert intent.destination == "San Sebastián"
+
+    def test_accented_city_keeps_spelling(self):
+        """Accented and plain spellings both match, returned as typed."""
+        assert parse_intent("Train to Cádiz").destination == "Cádiz"
+        assert parse_intent("Train to Cadiz").destination == "Cadiz"
+        assert parse_intent("Tren a Logroño").destination == "Logroño"
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -85,3 +101,14 @@ class TestEdgeCases:
         """Handle nonsense input."""
         intent = parse_intent("asdf jkl qwerty")
         assert intent.destination is None
+
+    def test_case_folded_destination(self):
+        """Letters that only case-fold to a city (long s) don't crash the lookup."""
+        assert parse_intent("Train to ſevilla").destination == "Sevilla"
+        assert parse_intent("billete ſantander").destination == "Santander"
+
+    def test_case_folded_origin(self):
+        """The origin path resolves case-folded city names too."""
+        intent = parse_intent("from ſalamanca to madrid")
+        assert intent.origin == "Salamanca"
+        assert intent.destination == "Madrid"
@@ -41,12 +41,37 @@ class TestLocationDisambiguation:
         assert match.confidence < 0.5
         assert match.is_ambiguous
 
+    def test_typo_city(self):
+        """City one edit away from a known city is suggested, not trusted."""
+        match = disambiguate_location("Barcelna")
+        assert "Sants" in match.name
+        assert match.is_ambiguous
+        assert match.confidence < 0.5
+        assert match.alternatives is None
+
+        match = disambiguate_location("Sevlila")  # Swapped letters
+        assert match.name == "Sevilla-Santa Justa"
+
+    def test_two_edits_not_a_typo(self):
+        """Names two edits from a known city are not treated as typos."""
+        for name in ("xmadri", "lmadri"):  # Both two edits from "madrid"
+            match = disambiguate_location(name)
+            assert match.code == ""
+            assert match.name == name
+
     def test_accented_city(self):
         """Handle accented city names."""
         match = disambiguate_location("Málaga")
         assert "Málaga" in match.name or "Malaga" in match.name
         assert match.confidence >= 0.7
 
+    def test_accent_insensitive(self):
+        """Accented and plain spellings resolve to the same station."""
+        plain = disambiguate_location("Cordoba")
+        accented = disambiguate_location("Córdoba")
+        assert plain.name == accented.name == "Córdoba Central"
+        assert accented.confidence == 1.0
+
 
 class TestGetAllStations:
     """Test getting all stations for a city."""
@@ -109,6 +109,18 @@ class TestMatcher:
         assert result.recommended_booking is not None
         assert result.recommended_booking.available
 
+    def test_top_five_matches(self):
+        """Only the five best bookings are returned, best first."""
+        intent = UserIntent(destination="Barcelona", origin="Madrid")
+
+        bookings = [make_booking(h, available=(h % 2 == 0)) for h in range(6, 16)]
+
+        result = match_intent_to_bookings(intent, bookings)
+
+        assert len(result.matched_bookings) == 5
+        assert all(b.available for b in result.matched_bookings)
+        assert result.recommended_booking == bookings[0]
+
     def test_missing_destination_warning(self):
         """Missing destination generates warning."""
         intent = UserIntent()  # Empty intent
@@ -155,3 +167,32 @@ class TestMatcher:
         result = match_intent_to_bookings(intent, [])
 
         assert not result.safe_to_book
+
+    def test_typo_destination_not_safe(self):
+        """A real city one edit from a known one is flagged, not greenlit."""
+        intent = UserIntent(
+            origin="Sevilla",
+            destination="Palencia",
+            date="tomorrow",
+            time_preference="09:00",
+        )
+
+        result = match_intent_to_bookings(intent, [make_booking(9)])
+
+        assert not result.safe_to_book
+        high = [w for w in result.warnings if w.severity == "high"]
+        assert len(high) == 1
+        assert high[0].message.startswith("Unknown destination: Palencia")
+        assert not any("Multiple stations in Palencia" in w.message for w in result.warnings)
+
+    def test_today_not_in_past(self):
+        """'today' is not flagged as a past date."""
+        intent = UserIntent(
+            destination="Sevilla",
+            origin="Granada",
+            date="today",
+        )
+
+        result = match_intent_to_bookings(intent, [])
+
+        assert not any(w.message == "Date is in the past" for w in result.warnings)